@@ -0,0 +1,106 @@
+from enum import Enum
+from typing import List, Optional
+
+import pytest
+
+import strawberry
+
+
+@strawberry.enum
+class IceCreamFlavour(Enum):
+    VANILLA = "vanilla"
+    STRAWBERRY = "strawberry"
+    CHOCOLATE = "chocolate"
+    PISTACHIO = "pistachio"
+
+
+_STRAWBERRY = IceCreamFlavour.STRAWBERRY
+_PISTACHIO = IceCreamFlavour.PISTACHIO
+
+
+@strawberry.enum(name="IceCreamFlavour")
+class FalsyIceCreamFlavour(Enum):
+    VANILLA = ""
+    STRAWBERRY = 0
+
+
+@strawberry.type
+class Cone:
+    flavour: IceCreamFlavour
+
+
+@strawberry.input
+class ConeInput:
+    flavour: IceCreamFlavour
+
+
+@strawberry.input(name="Input")
+class FalsyFlavourInput:
+    flavour: FalsyIceCreamFlavour
+    optionalFlavour: Optional[FalsyIceCreamFlavour] = None
+
+
+@pytest.fixture(scope="module")
+def ice_cream_schema():
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def best_flavour(self) -> IceCreamFlavour:
+            return _STRAWBERRY
+
+        @strawberry.field
+        def best_flavours(self) -> List[IceCreamFlavour]:
+            return [_STRAWBERRY, _PISTACHIO]
+
+        @strawberry.field
+        def discontinued_flavours(self) -> Optional[List[IceCreamFlavour]]:
+            return None
+
+        @strawberry.field
+        def cone(self) -> Cone:
+            return Cone(flavour=_STRAWBERRY)
+
+    return strawberry.Schema(query=Query)
+
+
+@pytest.fixture(scope="module")
+def ice_cream_mutation_schema():
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def flavour_available(self, flavour: IceCreamFlavour) -> bool:
+            return flavour == _STRAWBERRY
+
+    @strawberry.type
+    class Mutation:
+        @strawberry.mutation
+        def eat_cone(self, input: ConeInput) -> bool:
+            return input.flavour == _STRAWBERRY
+
+    return strawberry.Schema(query=Query, mutation=Mutation)
+
+
+@pytest.fixture(scope="module")
+def async_ice_cream_schema():
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def best_flavour(self) -> IceCreamFlavour:
+            return _STRAWBERRY
+
+        @strawberry.field
+        async def best_flavours(self) -> List[IceCreamFlavour]:
+            return [_STRAWBERRY, _PISTACHIO]
+
+    return strawberry.Schema(query=Query)
+
+
+@pytest.fixture(scope="module")
+def falsy_ice_cream_schema():
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def print_flavour(self, input: FalsyFlavourInput) -> str:
+            return f"{input.flavour.value}"
+
+    return strawberry.Schema(query=Query)
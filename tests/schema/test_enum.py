@@ -1,228 +1,98 @@
-import typing
-from enum import Enum
-from typing import List, Optional
+import asyncio
 
 import pytest
 
-import strawberry
 
+@pytest.fixture(scope="module")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
-def test_enum_resolver():
-    @strawberry.enum
-    class IceCreamFlavour(Enum):
-        VANILLA = "vanilla"
-        STRAWBERRY = "strawberry"
-        CHOCOLATE = "chocolate"
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def best_flavour(self) -> IceCreamFlavour:
-            return IceCreamFlavour.STRAWBERRY
-
-    schema = strawberry.Schema(query=Query)
 
+def test_enum_resolver(ice_cream_schema):
     query = "{ bestFlavour }"
 
-    result = schema.execute_sync(query)
+    result = ice_cream_schema.execute_sync(query)
 
     assert not result.errors
     assert result.data["bestFlavour"] == "STRAWBERRY"
 
-    @strawberry.type
-    class Cone:
-        flavour: IceCreamFlavour
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def cone(self) -> Cone:
-            return Cone(flavour=IceCreamFlavour.STRAWBERRY)
-
-    schema = strawberry.Schema(query=Query)
-
     query = "{ cone { flavour } }"
 
-    result = schema.execute_sync(query)
+    result = ice_cream_schema.execute_sync(query)
 
     assert not result.errors
     assert result.data["cone"]["flavour"] == "STRAWBERRY"
 
 
-def test_enum_arguments():
-    @strawberry.enum
-    class IceCreamFlavour(Enum):
-        VANILLA = "vanilla"
-        STRAWBERRY = "strawberry"
-        CHOCOLATE = "chocolate"
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def flavour_available(self, flavour: IceCreamFlavour) -> bool:
-            return flavour == IceCreamFlavour.STRAWBERRY
-
-    @strawberry.input
-    class ConeInput:
-        flavour: IceCreamFlavour
-
-    @strawberry.type
-    class Mutation:
-        @strawberry.mutation
-        def eat_cone(self, input: ConeInput) -> bool:
-            return input.flavour == IceCreamFlavour.STRAWBERRY
-
-    schema = strawberry.Schema(query=Query, mutation=Mutation)
-
-    query = "{ flavourAvailable(flavour: VANILLA) }"
-    result = schema.execute_sync(query)
-
-    assert not result.errors
-    assert result.data["flavourAvailable"] is False
-
-    query = "{ flavourAvailable(flavour: STRAWBERRY) }"
-    result = schema.execute_sync(query)
+def test_enum_arguments(ice_cream_mutation_schema):
+    query = """{
+        vanilla: flavourAvailable(flavour: VANILLA)
+        strawberry: flavourAvailable(flavour: STRAWBERRY)
+    }"""
+    result = ice_cream_mutation_schema.execute_sync(query)
 
     assert not result.errors
-    assert result.data["flavourAvailable"] is True
+    assert result.data == {"vanilla": False, "strawberry": True}
 
-    query = "mutation { eatCone(input: { flavour: VANILLA }) }"
-    result = schema.execute_sync(query)
+    query = """mutation {
+        vanilla: eatCone(input: { flavour: VANILLA })
+        strawberry: eatCone(input: { flavour: STRAWBERRY })
+    }"""
+    result = ice_cream_mutation_schema.execute_sync(query)
 
     assert not result.errors
-    assert result.data["eatCone"] is False
-
-    query = "mutation { eatCone(input: { flavour: STRAWBERRY }) }"
-    result = schema.execute_sync(query)
-
-    assert not result.errors
-    assert result.data["eatCone"] is True
-
+    assert result.data == {"vanilla": False, "strawberry": True}
 
-def test_enum_falsy_values():
-    @strawberry.enum
-    class IceCreamFlavour(Enum):
-        VANILLA = ""
-        STRAWBERRY = 0
 
-    @strawberry.input
-    class Input:
-        flavour: IceCreamFlavour
-        optionalFlavour: typing.Optional[IceCreamFlavour] = None
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def print_flavour(self, input: Input) -> str:
-            return f"{input.flavour.value}"
-
-    schema = strawberry.Schema(query=Query)
-
-    query = "{ printFlavour(input: { flavour: VANILLA }) }"
-    result = schema.execute_sync(query)
+@pytest.mark.parametrize(
+    "query,expected_value",
+    [
+        ("{ printFlavour(input: { flavour: VANILLA }) }", ""),
+        ("{ printFlavour(input: { flavour: STRAWBERRY }) }", "0"),
+    ],
+)
+def test_enum_falsy_values(falsy_ice_cream_schema, query, expected_value):
+    result = falsy_ice_cream_schema.execute_sync(query)
 
     assert not result.errors
-    assert result.data["printFlavour"] == ""
-
-    query = "{ printFlavour(input: { flavour: STRAWBERRY }) }"
-    result = schema.execute_sync(query)
-
-    assert not result.errors
-    assert result.data["printFlavour"] == "0"
-
-
-def test_enum_in_list():
-    @strawberry.enum
-    class IceCreamFlavour(Enum):
-        VANILLA = "vanilla"
-        STRAWBERRY = "strawberry"
-        CHOCOLATE = "chocolate"
-        PISTACHIO = "pistachio"
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def best_flavours(self) -> List[IceCreamFlavour]:
-            return [IceCreamFlavour.STRAWBERRY, IceCreamFlavour.PISTACHIO]
+    assert result.data["printFlavour"] == expected_value
 
-    schema = strawberry.Schema(query=Query)
 
+def test_enum_in_list(ice_cream_schema):
     query = "{ bestFlavours }"
 
-    result = schema.execute_sync(query)
+    result = ice_cream_schema.execute_sync(query)
 
     assert not result.errors
     assert result.data["bestFlavours"] == ["STRAWBERRY", "PISTACHIO"]
 
 
-def test_enum_in_optional_list():
-    @strawberry.enum
-    class IceCreamFlavour(Enum):
-        VANILLA = "vanilla"
-        STRAWBERRY = "strawberry"
-        CHOCOLATE = "chocolate"
-        PISTACHIO = "pistachio"
+def test_enum_in_optional_list(ice_cream_schema):
+    query = "{ discontinuedFlavours }"
 
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def best_flavours(self) -> Optional[List[IceCreamFlavour]]:
-            return None
-
-    schema = strawberry.Schema(query=Query)
-
-    query = "{ bestFlavours }"
-
-    result = schema.execute_sync(query)
+    result = ice_cream_schema.execute_sync(query)
 
     assert not result.errors
-    assert result.data["bestFlavours"] is None
+    assert result.data["discontinuedFlavours"] is None
 
 
 @pytest.mark.asyncio
-async def test_enum_resolver_async():
-    @strawberry.enum
-    class IceCreamFlavour(Enum):
-        VANILLA = "vanilla"
-        STRAWBERRY = "strawberry"
-        CHOCOLATE = "chocolate"
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        async def best_flavour(self) -> IceCreamFlavour:
-            return IceCreamFlavour.STRAWBERRY
-
-    schema = strawberry.Schema(query=Query)
-
+async def test_enum_resolver_async(async_ice_cream_schema):
     query = "{ bestFlavour }"
 
-    result = await schema.execute(query)
+    result = await async_ice_cream_schema.execute(query)
 
     assert not result.errors
     assert result.data["bestFlavour"] == "STRAWBERRY"
 
 
 @pytest.mark.asyncio
-async def test_enum_in_list_async():
-    @strawberry.enum
-    class IceCreamFlavour(Enum):
-        VANILLA = "vanilla"
-        STRAWBERRY = "strawberry"
-        CHOCOLATE = "chocolate"
-        PISTACHIO = "pistachio"
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        async def best_flavours(self) -> List[IceCreamFlavour]:
-            return [IceCreamFlavour.STRAWBERRY, IceCreamFlavour.PISTACHIO]
-
-    schema = strawberry.Schema(query=Query)
-
+async def test_enum_in_list_async(async_ice_cream_schema):
     query = "{ bestFlavours }"
 
-    result = await schema.execute(query)
+    result = await async_ice_cream_schema.execute(query)
 
     assert not result.errors
     assert result.data["bestFlavours"] == ["STRAWBERRY", "PISTACHIO"]
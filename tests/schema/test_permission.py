@@ -1,4 +1,5 @@
 import typing
+from contextvars import ContextVar
 
 import pytest
 
@@ -7,169 +8,146 @@ from strawberry.permission import BasePermission
 from strawberry.types import Info
 
 
-def test_raises_graphql_error_when_permission_method_is_missing():
-    class IsAuthenticated(BasePermission):
-        pass
-
-    @strawberry.type
-    class Query:
-        @strawberry.field(permission_classes=[IsAuthenticated])
-        def user(self) -> str:
-            return "patrick"
-
-    schema = strawberry.Schema(query=Query)
-
-    query = "{ user }"
-
-    result = schema.execute_sync(query)
-    assert (
-        result.errors[0].message
-        == "Permission classes should override has_permission method"
-    )
-
+Policy = typing.Tuple[typing.Callable[..., bool], str]
 
-def test_raises_graphql_error_when_permission_is_denied():
-    class IsAuthenticated(BasePermission):
-        message = "User is not authenticated"
+current_policy: ContextVar[typing.Optional[Policy]] = ContextVar(
+    "current_policy", default=None
+)
 
-        def has_permission(self, source: typing.Any, info: Info, **kwargs) -> bool:
-            return False
 
-    @strawberry.type
-    class Query:
-        @strawberry.field(permission_classes=[IsAuthenticated])
-        def user(self) -> str:
-            return "patrick"
+class _TestPermission(BasePermission):
+    @property
+    def message(self) -> typing.Optional[str]:  # type: ignore
+        policy = current_policy.get()
 
-    schema = strawberry.Schema(query=Query)
+        return policy[1] if policy else None
 
-    query = "{ user }"
+    def has_permission(self, source: typing.Any, info: Info, **kwargs) -> bool:
+        policy = current_policy.get()
 
-    result = schema.execute_sync(query)
-    assert result.errors[0].message == "User is not authenticated"
+        if policy is None:
+            return super().has_permission(source, info, **kwargs)
 
+        check, _ = policy
 
-@pytest.mark.asyncio
-async def test_raises_permission_error_for_subscription():
-    class IsAdmin(BasePermission):
-        message = "You are not authorized"
+        return check(source, info, **kwargs)
 
-        def has_permission(self, source: typing.Any, info: Info, **kwargs) -> bool:
-            return False
 
-    @strawberry.type
-    class Query:
-        name: str = "Andrew"
+def set_policy(check: typing.Callable[..., bool], message: str) -> None:
+    current_policy.set((check, message))
 
-    @strawberry.type
-    class Subscription:
-        @strawberry.subscription(permission_classes=[IsAdmin])
-        async def user(self, info) -> typing.AsyncGenerator[str, None]:
-            yield "Hello"
 
-    schema = strawberry.Schema(query=Query, subscription=Subscription)
+@strawberry.type
+class User:
+    name: str
+    email: str = strawberry.field(permission_classes=[_TestPermission])
 
-    query = "subscription { user }"
+    @strawberry.field(permission_classes=[_TestPermission])
+    def resolved_email(self) -> str:
+        return "patrick.arminio@gmail.com"
 
-    result = await schema.subscribe(query)
+    @strawberry.field(permission_classes=[_TestPermission])
+    def secure_email(self, secure: bool) -> str:
+        return "patrick.arminio@gmail.com"
 
-    assert result.errors[0].message == "You are not authorized"
 
+@strawberry.type
+class Query:
+    @strawberry.field(permission_classes=[_TestPermission])
+    def me(self) -> str:
+        return "patrick"
 
-def test_can_use_source_when_testing_permission():
-    class CanSeeEmail(BasePermission):
-        message = "Cannot see email for this user"
+    @strawberry.field
+    def user(self, name: str) -> User:
+        return User(name=name, email="patrick.arminio@gmail.com")
 
-        def has_permission(self, source: typing.Any, info: Info, **kwargs) -> bool:
-            return source.name.lower() == "patrick"
 
-    @strawberry.type
-    class User:
-        name: str
+@strawberry.type
+class Subscription:
+    @strawberry.subscription(permission_classes=[_TestPermission])
+    async def user(self, info) -> typing.AsyncGenerator[str, None]:
+        yield "Hello"
 
-        @strawberry.field(permission_classes=[CanSeeEmail])
-        def email(self) -> str:
-            return "patrick.arminio@gmail.com"
 
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def user(self, name: str) -> User:
-            return User(name=name)
+schema = strawberry.Schema(query=Query, subscription=Subscription)
 
-    schema = strawberry.Schema(query=Query)
 
-    query = '{ user(name: "patrick") { email } }'
+@pytest.fixture(autouse=True)
+def reset_policy():
+    token = current_policy.set(None)
+    yield
+    current_policy.reset(token)
 
-    result = schema.execute_sync(query)
-    assert result.data["user"]["email"] == "patrick.arminio@gmail.com"
 
-    query = '{ user(name: "marco") { email } }'
+def test_raises_graphql_error_when_permission_method_is_missing():
+    query = "{ me }"
 
     result = schema.execute_sync(query)
-    assert result.errors[0].message == "Cannot see email for this user"
-
-
-def test_can_use_args_when_testing_permission():
-    class CanSeeEmail(BasePermission):
-        message = "Cannot see email for this user"
-
-        def has_permission(self, source: typing.Any, info: Info, **kwargs) -> bool:
-            return kwargs.get("secure", False)
-
-    @strawberry.type
-    class User:
-        name: str
-
-        @strawberry.field(permission_classes=[CanSeeEmail])
-        def email(self, secure: bool) -> str:
-            return "patrick.arminio@gmail.com"
-
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def user(self, name: str) -> User:
-            return User(name=name)
-
-    schema = strawberry.Schema(query=Query)
+    assert (
+        result.errors[0].message
+        == "Permission classes should override has_permission method"
+    )
 
-    query = '{ user(name: "patrick") { email(secure: true) } }'
 
-    result = schema.execute_sync(query)
-    assert result.data["user"]["email"] == "patrick.arminio@gmail.com"
+def test_raises_graphql_error_when_permission_is_denied():
+    set_policy(lambda source, info, **kwargs: False, "User is not authenticated")
 
-    query = '{ user(name: "patrick") { email(secure: false) } }'
+    query = "{ me }"
 
     result = schema.execute_sync(query)
-    assert result.errors[0].message == "Cannot see email for this user"
-
-
-def test_can_use_on_simple_fields():
-    class CanSeeEmail(BasePermission):
-        message = "Cannot see email for this user"
-
-        def has_permission(self, source: typing.Any, info: Info, **kwargs) -> bool:
-            return source.name.lower() == "patrick"
+    assert result.errors[0].message == "User is not authenticated"
 
-    @strawberry.type
-    class User:
-        name: str
-        email: str = strawberry.field(permission_classes=[CanSeeEmail])
 
-    @strawberry.type
-    class Query:
-        @strawberry.field
-        def user(self, name: str) -> User:
-            return User(name=name, email="patrick.arminio@gmail.com")
+@pytest.mark.asyncio
+async def test_raises_permission_error_for_subscription():
+    set_policy(lambda source, info, **kwargs: False, "You are not authorized")
 
-    schema = strawberry.Schema(query=Query)
+    query = "subscription { user }"
 
-    query = '{ user(name: "patrick") { email } }'
+    result = await schema.subscribe(query)
 
-    result = schema.execute_sync(query)
-    assert result.data["user"]["email"] == "patrick.arminio@gmail.com"
+    assert result.errors[0].message == "You are not authorized"
 
-    query = '{ user(name: "marco") { email } }'
 
-    result = schema.execute_sync(query)
+def _is_patrick(source: typing.Any, info: Info, **kwargs) -> bool:
+    return source.name.lower() == "patrick"
+
+
+def _is_secure(source: typing.Any, info: Info, **kwargs) -> bool:
+    return kwargs.get("secure", False)
+
+
+@pytest.mark.parametrize(
+    "check,field,allowed_query,denied_query",
+    [
+        pytest.param(
+            _is_patrick,
+            "resolvedEmail",
+            '{ user(name: "patrick") { resolvedEmail } }',
+            '{ user(name: "marco") { resolvedEmail } }',
+            id="source",
+        ),
+        pytest.param(
+            _is_secure,
+            "secureEmail",
+            '{ user(name: "patrick") { secureEmail(secure: true) } }',
+            '{ user(name: "patrick") { secureEmail(secure: false) } }',
+            id="args",
+        ),
+        pytest.param(
+            _is_patrick,
+            "email",
+            '{ user(name: "patrick") { email } }',
+            '{ user(name: "marco") { email } }',
+            id="simple-field",
+        ),
+    ],
+)
+def test_can_use_permission_on_user_fields(check, field, allowed_query, denied_query):
+    set_policy(check, "Cannot see email for this user")
+
+    result = schema.execute_sync(allowed_query)
+    assert result.data["user"][field] == "patrick.arminio@gmail.com"
+
+    result = schema.execute_sync(denied_query)
     assert result.errors[0].message == "Cannot see email for this user"